@@ -18,8 +18,24 @@ CRAWL_CONFIG = {
         'min': 2,  # 最小待機時間（秒）
         'max': 5   # 最大待機時間（秒）
     },
-    'scroll_config': {
-        'max_scroll': 10,  # 最大スクロール回数
-        'scroll_pause_time': 1.5  # スクロール間の待機時間（秒）
-    }
+    'list_load_config': {
+        'timeout': 15,  # 動画一覧の読み込みを待つ最大時間（秒）
+        'stable_time': 1.5  # この時間ページが伸びなければ読み込み完了とみなす（秒）
+    },
+    # ブラウザでクロールしたアカウントがこの件数に達するごとにブラウザを再起動する
+    # ブラウザは実行ごとに作り直すので、1回の実行（既定で最大10アカウント）の中で効くよう、それより小さくする
+    # HTTPの先読みで済んだアカウントはブラウザを使わないので数えない
+    'driver_recycle_accounts': 5,
+    'http_concurrency': 4,  # ブラウザを使わない一覧取得の同時接続数
+    'max_pending_saves': 4  # 保存用スレッドに溜めておけるDB保存の数
+}
+
+# Selenium設定
+SELENIUM_CONFIG = {
+    # クローラーアカウントごとのChromeプロファイルを置くディレクトリ（ログイン状態を使い回す）
+    'profile_dir': os.getenv('CHROME_PROFILE_DIR', 'chrome_profiles'),
+    # ログイン後のクッキーを保存するディレクトリ（プロファイルに残らないセッションクッキー用）
+    'cookie_dir': os.getenv('COOKIE_DIR', 'cookies'),
+    # ヘッドレスで動かすか（ボット判定されやすくなるのでデフォルトは無効）
+    'headless': os.getenv('CHROME_HEADLESS', 'false').lower() == 'true'
 }
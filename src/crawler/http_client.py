@@ -0,0 +1,68 @@
+import json
+import re
+import urllib3
+from typing import Dict, List, Optional
+from ..logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# HTMLに埋め込まれた状態JSONを取り出す正規表現（旧形式のSIGI_STATEを優先）
+EMBEDDED_STATE_PATTERNS = [
+    re.compile(r'<script id="SIGI_STATE"[^>]*>(.*?)</script>', re.S),
+    re.compile(r'<script id="__UNIVERSAL_DATA_FOR_REHYDRATION__"[^>]*>(.*?)</script>', re.S),
+]
+
+class TikTokHttpClient:
+    """
+    Seleniumのセッション（Cookie・User-Agent・プロキシ）を引き継いで、ブラウザを使わずにページを取得するクライアント
+    接続はプールしてkeep-aliveで使い回す
+    """
+
+    def __init__(self, cookies: List[Dict], user_agent: str, proxy: Optional[str] = None, maxsize: int = 1):
+        """
+        Args:
+            cookies: driver.get_cookies() の戻り値
+            user_agent: ブラウザのUser-Agent
+            proxy: プロキシ（Chromeの--proxy-serverと同じ形式。スキームが無ければhttp://とみなす）
+            maxsize: 使い回す接続数（並列に取得するならその数）
+        """
+        self.headers = {
+            "User-Agent": user_agent,
+            "Accept-Language": "ja-JP,ja;q=0.9",
+            "Cookie": "; ".join(f"{cookie['name']}={cookie['value']}" for cookie in cookies),
+        }
+        pool_options = {"num_pools": 1, "maxsize": maxsize, "timeout": urllib3.Timeout(connect=10, read=30)}
+        if proxy:
+            # Chromeはhost:portだけでも受け付けるが、urllib3はスキームが無いとProxySchemeUnknownになる
+            if "://" not in proxy:
+                proxy = f"http://{proxy}"
+            self.http = urllib3.ProxyManager(proxy, **pool_options)
+        else:
+            self.http = urllib3.PoolManager(**pool_options)
+
+    def get_embedded_state(self, url: str) -> Optional[Dict]:
+        """
+        ページを取得して埋め込みJSONをパースする
+        
+        Returns:
+            パースしたJSON。取得できなかった場合（キャプチャのページなど）はNone
+        """
+        try:
+            response = self.http.request("GET", url, headers=self.headers)
+            if response.status != 200:
+                logger.warning(f"ページの取得に失敗: {url} -> {response.status}")
+                return None
+
+            html = response.data.decode("utf-8", errors="replace")
+            for pattern in EMBEDDED_STATE_PATTERNS:
+                match = pattern.search(html)
+                if match:
+                    return json.loads(match.group(1))
+            return None
+
+        except Exception as e:
+            logger.warning(f"ページの取得に失敗: {url} -> {e}")
+            return None
+
+    def close(self):
+        self.http.clear()
@@ -0,0 +1,159 @@
+import re
+from functools import lru_cache
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+
+# 動画（写真投稿も含む）URLのアカウント名と動画ID
+VIDEO_URL_PATTERN = re.compile(r"/@([^/?#]+)/(?:video|photo)/(\d+)")
+
+
+def parse_tiktok_video_url(url: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    動画URLからアカウント名と動画IDを取り出す
+
+    Args:
+        url: 動画のURL（例: https://www.tiktok.com/@username/video/1234567890）
+
+    Returns:
+        (account_username, video_id)。動画のURLでなければ (None, None)
+    """
+    match = VIDEO_URL_PATTERN.search(url) if url else None
+    if not match:
+        return None, None
+    return match.group(1), match.group(2)
+
+
+# いいね数・再生数の表示形式（例: 1234 / 1,234 / 12.3K / 1.2M / 1.2万）
+COUNT_PATTERN = re.compile(r"^(\d[\d,]*(?:\.\d+)?)([KMGB万億]?)$", re.I)
+COUNT_MULTIPLIERS = {"": 1, "K": 1_000, "M": 1_000_000, "G": 1_000_000_000, "B": 1_000_000_000, "万": 10_000, "億": 100_000_000}
+
+
+@lru_cache(maxsize=4096)
+def parse_tiktok_count(count_text: str) -> Optional[int]:
+    """
+    表示形式のいいね数・再生数を整数にする
+    丸めた表示（1.2Kなど）は同じ文字列がよく出てくるのでキャッシュする
+
+    Returns:
+        数値。知らない形式ならNone
+    """
+    # 数値として読める形だけを正規表現で通すので、floatは失敗しない
+    match = COUNT_PATTERN.match(count_text.strip())
+    if not match:
+        return None
+    number = float(match.group(1).replace(",", ""))
+    return round(number * COUNT_MULTIPLIERS[match.group(2).upper()])
+
+
+# 動画ページの投稿日時の表示形式（例: 4日前 / 2024-2-15 / 2-15）を1回のマッチで振り分ける
+# グループ: 1-2 相対表記（数値・単位）/ 3-5 年月日 / 6-7 月日
+TIME_PATTERN = re.compile(
+    r"^(?:(\d+)(秒|分|時間|日|週間)前"
+    r"|(\d{4})-(\d{1,2})-(\d{1,2})"
+    r"|(\d{1,2})-(\d{1,2}))$"
+)
+RELATIVE_TIME_UNITS = {"秒": "seconds", "分": "minutes", "時間": "hours", "日": "days", "週間": "weeks"}
+
+
+def parse_tiktok_time(time_text: str, now: datetime) -> Optional[datetime]:
+    """
+    動画ページに表示される投稿日時をdatetimeにする
+
+    Args:
+        time_text: 表示されている投稿日時（例: 4日前）
+        now: 相対表記の基準にする時刻（クロール時刻）
+
+    Returns:
+        投稿日時。知らない形式（存在しない日付を含む）ならNone
+    """
+    # どの形式も数字で始まるので、空や想定外の文字列は正規表現を試さずに弾く
+    if not time_text or not time_text[0].isdigit():
+        return None
+
+    match = TIME_PATTERN.match(time_text)
+    if not match:
+        return None
+    amount, unit, year, month, day, short_month, short_day = match.groups()
+
+    if amount:
+        return now - timedelta(**{RELATIVE_TIME_UNITS[unit]: int(amount)})
+
+    try:
+        if year:
+            return datetime(int(year), int(month), int(day))
+
+        # 年が省略されるのは今年の投稿だが、年明け直後のずれに備えて未来なら前年とみなす
+        posted_at = datetime(now.year, int(short_month), int(short_day))
+        return posted_at if posted_at <= now else posted_at.replace(year=now.year - 1)
+    except ValueError:
+        return None
+
+
+def _get_item_module(state: Dict) -> Dict:
+    # 旧形式はトップレベル、新形式は__DEFAULT_SCOPE__の下にItemModuleがある
+    return state.get("ItemModule") or state.get("__DEFAULT_SCOPE__", {}).get("ItemModule") or {}
+
+
+def _parse_item(item: Dict, base_url: str) -> Optional[Dict]:
+    """
+    埋め込みJSONの動画1件を、説明・いいね数・再生数の辞書にする
+
+    Returns:
+        動画の辞書。動画IDか投稿者が無ければ（URLを組み立てられないので）None
+    """
+    stats = item.get("stats", {})
+    author = item.get("author")
+    nickname = item.get("nickname", "")
+    if isinstance(author, dict):
+        nickname = author.get("nickname", nickname)
+        author = author.get("uniqueId")
+    if not item.get("id") or not author:
+        return None
+
+    create_time = int(item.get("createTime", 0))
+    posted_at = datetime.fromtimestamp(create_time) if create_time else None
+    return {
+        "url": f"{base_url}/@{author}/video/{item['id']}",
+        "video_id": item["id"],
+        "account_username": author,
+        "account_nickname": nickname,
+        "title": item.get("desc", ""),
+        # DOMから取った場合の表示（2024-1-5など）に揃える
+        "posted_at_text": f"{posted_at.year}-{posted_at.month}-{posted_at.day}" if posted_at else "",
+        "posted_at": posted_at,
+        "like_count": stats.get("diggCount"),
+        "play_count": stats.get("playCount"),
+    }
+
+
+def parse_embedded_video_list(state: Dict, base_url: str) -> List[Dict]:
+    """
+    ページに埋め込まれたJSON（SIGI_STATE / __UNIVERSAL_DATA_FOR_REHYDRATION__）から動画一覧を取り出す
+
+    Args:
+        state: 埋め込みJSONをパースしたもの
+        base_url: 動画URLの組み立てに使うTikTokのURL
+
+    Returns:
+        動画ごとの辞書のリスト。ItemModuleが無ければ空リスト
+    """
+    videos = (_parse_item(item, base_url) for item in _get_item_module(state).values())
+    return [video for video in videos if video]
+
+
+def parse_embedded_video_detail(state: Dict, video_id: str, base_url: str) -> Optional[Dict]:
+    """
+    埋め込みJSONから指定した動画の情報を取り出す
+    動画ページの動画（新形式はwebapp.video-detail）のほか、ユーザーページの一覧に含まれる動画も探す
+
+    Returns:
+        動画の辞書（parse_embedded_video_listの要素と同じ形式）。見つからない・不完全ならNone
+    """
+    item = _get_item_module(state).get(video_id)
+    if not item:
+        detail = state.get("__DEFAULT_SCOPE__", {}).get("webapp.video-detail", {})
+        item = detail.get("itemInfo", {}).get("itemStruct")
+        if not item or item.get("id") != video_id:
+            return None
+    return _parse_item(item, base_url)
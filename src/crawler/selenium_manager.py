@@ -1,36 +1,88 @@
+import os
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium_stealth import stealth
+from typing import Optional
 from ..logger import setup_logger
+from ..config import SELENIUM_CONFIG
 
 logger = setup_logger(__name__)
 
+# CDPでブロックするURLパターン（画像はクエリ付きで配信されるので末尾にも*を付ける）
+BLOCKED_URL_PATTERNS = [
+    # 画像
+    '*.jpg', '*.jpg?*',
+    '*.jpeg', '*.jpeg?*',
+    '*.png', '*.png?*',
+    '*.webp', '*.webp?*',
+    '*.gif', '*.gif?*',
+    '*.image?*',
+    # 動画
+    '*.mp4', '*.mp4?*',
+    '*.m4s', '*.m4s?*',
+    '*.ts', '*.ts?*',
+    # フォント
+    '*.woff', '*.woff2', '*.ttf',
+    # 解析・ログ
+    '*mssdk*',
+    '*webcast*',
+    '*mon.tiktok*',
+    '*google-analytics*',
+    '*tiktokv.com/tiktok/log*',
+]
+
 class SeleniumManager:
-    def __init__(self, proxy: str = None):
+    def __init__(self, proxy: str = None, user_data_dir: Optional[str] = None):
         self.driver = None
         self.proxy = proxy
+        self.user_data_dir = user_data_dir
 
     def setup_driver(self):
         try:
             options = Options()
             if self.proxy:
                 options.add_argument(f'--proxy-server={self.proxy}')
+            if self.user_data_dir:
+                # プロファイルを使い回してCookie（ログイン状態）を次回以降も引き継ぐ
+                options.add_argument(f'--user-data-dir={os.path.abspath(self.user_data_dir)}')
             
+            if SELENIUM_CONFIG['headless']:
+                options.add_argument('--headless=new')
+
             # その他の設定
             options.add_argument('--no-sandbox')
-            options.add_argument('--use-angle=gl')
-            options.add_argument('--enable-features=Vulkan')
-            options.add_argument('--disable-vulkan-surface')
-            options.add_argument('--enable-gpu-rasterization')
-            options.add_argument('--enable-zero-copy')
-            options.add_argument('--ignore-gpu-blocklist')
-            options.add_argument('--enable-hardware-overlays')
-            options.add_argument('--enable-features=VaapiVideoDecoder')
+            options.add_argument('--disable-dev-shm-usage')
+            options.add_argument('--disable-gpu')
+            options.add_argument('--blink-settings=imagesEnabled=false')
             options.add_argument('--window-size=1280,720')
+
+            # クロールに関係ないバックグラウンド処理を止めて、1ブラウザあたりのCPU・メモリを減らす
+            options.add_argument('--disable-background-networking')
+            options.add_argument('--disable-background-timer-throttling')
+            options.add_argument('--disable-renderer-backgrounding')
+            # --disable-featuresは最後の1つしか効かないので1行にまとめる（サイトごとのプロセス分離もしない）
+            options.add_argument('--disable-features=Translate,BackForwardCache,MediaRouter,OptimizationHints,IsolateOrigins,site-per-process')
+            options.add_argument('--disable-sync')
+            options.add_argument('--metrics-recording-only')
+            options.add_argument('--disable-extensions')
+            # navigator.webdriverなど自動操作の痕跡をBlink側で出さない
+            options.add_argument('--disable-blink-features=AutomationControlled')
+
+            # テキストと属性しか読まないので、画像・メディアは読み込まない
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.media_stream": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+
+            # DOMContentLoadedの時点でdriver.getから戻る（画像や動画の読み込み完了は待たない）
+            # 必要な要素はWebDriverWaitで個別に待つ
+            options.page_load_strategy = 'eager'
             
             service = Service()
-            self.driver = webdriver.Chrome(service=service, options=options)
+            # chromedriverとの通信はコマンドごとに接続し直さず、keep-aliveで使い回す
+            self.driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
             
             # selenium-stealthの設定を適用
             stealth(
@@ -48,6 +100,10 @@ class SeleniumManager:
                 "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
             )
             
+            # クロールに使わない動画本体・解析系ビーコン・Webフォントの通信をブロック
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            
             logger.info("Chromeドライバーの設定が完了しました")
             return self.driver
         
@@ -58,4 +114,5 @@ class SeleniumManager:
     def quit_driver(self):
         if self.driver:
             self.driver.quit()
+            self.driver = None
             logger.info("Chromeドライバーを終了しました")
@@ -4,20 +4,122 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, WebDriverException
+from collections import deque
 from datetime import datetime
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+import json
+import multiprocessing
+import os
 import random
+import threading
 import time
-from typing import Optional, List, Dict, Tuple
+from typing import Callable, Optional, List, Dict, Tuple
 
 from ..database.models import VideoDescRawData, VideoPlayStatRawData, VideoLikeStatRawData, CrawlerAccount, FavoriteAccount
 from ..database.repositories import CrawlerAccountRepository, FavoriteAccountRepository, VideoRepository
-from ..database.database import Database
+from ..database.database import Database, TRANSIENT_DB_ERRORS
 from .selenium_manager import SeleniumManager
+from .parsers import parse_tiktok_video_url, parse_tiktok_count, parse_tiktok_time, parse_embedded_video_list, parse_embedded_video_detail
+from .http_client import TikTokHttpClient
 from ..logger import setup_logger
+from ..config import SELENIUM_CONFIG, CRAWL_CONFIG
+from ..retry import retry_with_backoff
 
 logger = setup_logger(__name__)
 
+# プロキシを使わないアカウントのロックのキー（プロキシのURLと被らない値）
+DIRECT_PROXY_KEY = "direct"
+
+# CSSセレクター（Pythonのロケーターとブラウザ内のスクリプトで共通に使う）
+POST_ITEM_CSS = "[data-e2e='user-post-item']"
+# 動画カードの数値は1つだけで、ユーザーページではいいね数、「クリエイターの動画」タブでは再生数として扱う
+# （同じ要素なので、1つの一覧から両方を取ることはできない）
+LIKE_COUNT_CSS = "[data-e2e='video-views']" # video-viewsといいながらいいね数なんだよな
+PLAY_COUNT_CSS = "strong[data-e2e='video-views'][class*='StrongVideoCount']"
+VIDEO_DESC_CSS = {
+    "account_username": "[data-e2e='user-title']",
+    "account_nickname": "[data-e2e='user-subtitle']",
+    "title": "[data-e2e='browse-video-desc']",
+    "posted_at_text": "[data-e2e='browser-nickname'] span:last-child",
+}
+
+# ロケーター（毎回タプルを組み立てないようモジュールレベルで定義）
+SELECTORS = {
+    "username_input": (By.CSS_SELECTOR, "input[name='username']"),
+    "password_input": (By.CSS_SELECTOR, "input[type='password']"),
+    "login_button": (By.CSS_SELECTOR, "button[type='submit']"),
+    "profile_icon": (By.CSS_SELECTOR, "[data-e2e='profile-icon']"),
+    "post_item": (By.CSS_SELECTOR, POST_ITEM_CSS),
+    "user_title": (By.CSS_SELECTOR, VIDEO_DESC_CSS["account_username"]),
+    "creator_videos_tab": (By.CSS_SELECTOR, "[class*='DivTabMenuContainer'] [class*='DivTabItemContainer']:nth-child(2) [class*='DivTabItem']"),
+    "creator_video_play_count": (By.CSS_SELECTOR, f"{POST_ITEM_CSS} {PLAY_COUNT_CSS}"),
+}
+
+# 待機条件（expected_conditionsの述語は使い回せるので事前に作っておく）
+WAITERS = {name: EC.presence_of_element_located(locator) for name, locator in SELECTORS.items()}
+WAITERS["login_button"] = EC.element_to_be_clickable(SELECTORS["login_button"])
+
+# 動画一覧を読み込みながら {url, link: リンク要素, counts: {項目名: 表示形式の数値}} をまとめて取り出す非同期スクリプト
+# 動画がwant件揃う・ページがstableTimeミリ秒伸びない・timeoutミリ秒経過、のいずれかまで
+# ブラウザ内でスクロールとポーリングを繰り返し、結果を1回で返す
+# 一覧のNodeListは1回だけ取得し、各動画内の検索はその動画要素を起点にする
+# テキストはレイアウト計算の要らないtextContentで読む
+VIDEO_STATS_SCRIPT = """
+const [want, itemSelector, countSelectors, timeout, stableTime] = arguments;
+const done = arguments[arguments.length - 1];
+const deadline = Date.now() + timeout;
+let lastHeight = -1;
+let lastGrowth = Date.now();
+const collect = items => {
+    const n = Math.min(items.length, want);
+    const stats = new Array(n);
+    for (let i = 0; i < n; i++) {
+        const a = items[i].querySelector("a[href]");
+        const counts = {};
+        for (const [key, selector] of Object.entries(countSelectors)) {
+            const c = items[i].querySelector(selector);
+            counts[key] = c ? c.textContent.trim() : null;
+        }
+        stats[i] = {url: a ? a.href : null, link: a, counts: counts};
+    }
+    return stats;
+};
+(function tick() {
+    const items = document.querySelectorAll(itemSelector);
+    const height = document.body.scrollHeight;
+    const now = Date.now();
+    if (height !== lastHeight) {
+        lastHeight = height;
+        lastGrowth = now;
+    }
+    if (items.length >= want || now > deadline || now - lastGrowth > stableTime) {
+        done(collect(items));
+        return;
+    }
+    window.scrollTo(0, height);
+    setTimeout(tick, 250);
+})();
+"""
+
+# ページに埋め込まれた状態JSONの文字列を返すスクリプト（旧形式のSIGI_STATEを優先）
+EMBEDDED_STATE_SCRIPT = """
+const e = document.getElementById("SIGI_STATE") || document.getElementById("__UNIVERSAL_DATA_FOR_REHYDRATION__");
+return e ? e.textContent : null;
+"""
+
+# 動画ページの説明部分をまとめて取り出すスクリプト（arguments[0]: 項目名 -> セレクター）
+VIDEO_DESC_SCRIPT = """
+const desc = {url: location.href};
+for (const [key, selector] of Object.entries(arguments[0])) {
+    const e = document.querySelector(selector);
+    desc[key] = e ? e.textContent.trim() : null;
+}
+return desc;
+"""
+
 class TikTokCrawler:
     BASE_URL = "https://www.tiktok.com"
     
@@ -39,6 +141,13 @@ class TikTokCrawler:
         self.selenium_manager = None
         self.driver = None
         self.wait = None
+        self.page_wait = None
+        self.short_wait = None
+        self.http_client = None
+        self._accounts_since_restart = 0
+        self._last_action_at = 0.0  # 最後にページを操作した時刻（time.monotonic）
+        self._save_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_saves = deque()
         
     def start(self, crawler_account_id: Optional[int] = None): # crawler_account_id が None なら適当に持ってくる
         try:
@@ -53,12 +162,11 @@ class TikTokCrawler:
                     raise Exception("利用可能なクローラーアカウントがありません")
 
             # Seleniumの設定
-            self.selenium_manager = SeleniumManager(self.crawler_account.proxy)
-            self.driver = self.selenium_manager.setup_driver()
-            self.wait = WebDriverWait(self.driver, 60)  # タイムアウトを60秒に変更
-
-            # ログイン
-            self._login()
+            self.selenium_manager = SeleniumManager(
+                self.crawler_account.proxy,
+                os.path.join(SELENIUM_CONFIG['profile_dir'], str(self.crawler_account.id))
+            )
+            self._setup_session()
 
             # 最終クロール時間を更新
             self.crawler_account_repo.update_crawler_account_last_crawled(
@@ -70,56 +178,156 @@ class TikTokCrawler:
             self.stop()
             raise
 
+    def _setup_session(self):
+        """ブラウザを起動してログインし、そのセッションをHTTPクライアントにも引き継ぐ"""
+        self.driver = self.selenium_manager.setup_driver()
+        # ポーリング間隔はデフォルトの0.5秒だと遅いので0.2秒に
+        self.wait = WebDriverWait(self.driver, 30, poll_frequency=0.2)  # ログインなど遅いと分かっている操作用
+        self.page_wait = WebDriverWait(self.driver, 15, poll_frequency=0.05)  # ページ移動後の要素用（描画されたらすぐ進む）
+        self.short_wait = WebDriverWait(self.driver, 5, poll_frequency=0.1)  # あるかどうか確認するだけの要素用
+        # 動画一覧の非同期スクリプトは読み込み待ちの上限より長く待てるように
+        self.driver.set_script_timeout(CRAWL_CONFIG['list_load_config']['timeout'] + 10)
+
+        # ログイン
+        self._login()
+
+        # 一覧の取得はブラウザを使わずに済むよう、ログイン後のセッションをHTTPクライアントに引き継ぐ
+        # urllib3で扱えないプロキシ（socks5://など）ならHTTPでの取得は諦めて、Seleniumだけで取得する
+        try:
+            self.http_client = TikTokHttpClient(
+                self.driver.get_cookies(),
+                self.driver.execute_script("return navigator.userAgent;"),
+                self.crawler_account.proxy,
+                maxsize=CRAWL_CONFIG['http_concurrency']
+            )
+        except ValueError as e:  # urllib3のProxySchemeUnknownはValueErrorの派生
+            logger.warning(f"HTTPクライアントを作成できないので、Seleniumだけで取得します: {e}")
+            self.http_client = None
+        self._accounts_since_restart = 0
+
+    def _recycle_driver_if_needed(self):
+        """長時間使うとブラウザのメモリが膨らむので、一定アカウント数ごとに再起動する"""
+        if self._accounts_since_restart < CRAWL_CONFIG['driver_recycle_accounts']:
+            return
+        logger.info(f"{self._accounts_since_restart}アカウント処理したのでブラウザを再起動します")
+        self.stop()
+        self._setup_session()
+
     def stop(self):
         """クローラーを停止する"""
+        if self.http_client:
+            self.http_client.close()
+            self.http_client = None
         if self.selenium_manager:
             self.selenium_manager.quit_driver()
             
     def _random_sleep(self, min_seconds: float = 1.0, max_seconds: float = 3.0):
         """
         ランダムな時間待機して人間らしい動きをシミュレート
+        前回の操作（クリック・入力・ページ移動）からの間隔がこの時間になるまで待つので、
+        ページの読み込みや要素の待機ですでに時間が経っていれば、その分は待たない
         
         Args:
             min_seconds: 最小待機時間（秒）
             max_seconds: 最大待機時間（秒）
         """
-        time.sleep(random.uniform(min_seconds, max_seconds))
+        remaining = random.uniform(min_seconds, max_seconds) - (time.monotonic() - self._last_action_at)
+        if remaining > 0:
+            time.sleep(remaining)
+        self._last_action_at = time.monotonic()
+
+    @retry_with_backoff(exceptions=(WebDriverException,))
+    def _get(self, url: str):
+        """ページに移動する（通信エラー時はバックオフしてリトライ）"""
+        self.driver.get(url)
+        self._last_action_at = time.monotonic()
+
+    def _is_logged_in(self) -> bool:
+        """プロフィールアイコンが表示されていればログイン済み"""
+        try:
+            self.short_wait.until(WAITERS["profile_icon"])
+            return True
+        except TimeoutException:
+            return False
+
+    def _cookie_path(self) -> str:
+        return os.path.join(SELENIUM_CONFIG['cookie_dir'], f"{self.crawler_account.id}.json")
+
+    def _save_cookies(self):
+        """ログイン後のクッキーをクローラーアカウントごとのファイルに保存"""
+        try:
+            os.makedirs(SELENIUM_CONFIG['cookie_dir'], exist_ok=True)
+            with open(self._cookie_path(), "w") as f:
+                json.dump(self.driver.get_cookies(), f)
+        except OSError as e:
+            logger.warning(f"クッキーの保存に失敗: {e}")
+
+    def _restore_cookies(self) -> bool:
+        """
+        保存したクッキーをブラウザに読み込んでページを再読み込みする
+        （TikTokのページを開いた状態で呼ぶこと）
+
+        Returns:
+            クッキーを読み込んだかどうか
+        """
+        cookie_path = self._cookie_path()
+        if not os.path.exists(cookie_path):
+            return False
+        try:
+            with open(cookie_path) as f:
+                cookies = json.load(f)
+            for cookie in cookies:
+                # 有効期限はSeleniumがfloatを受け付けないので整数に
+                if "expiry" in cookie:
+                    cookie["expiry"] = int(cookie["expiry"])
+                self.driver.add_cookie(cookie)
+        except (OSError, ValueError, WebDriverException) as e:
+            logger.warning(f"クッキーの復元に失敗: {e}")
+            return False
+        self.driver.refresh()
+        return True
 
     def _login(self):
         """TikTokにログインする"""
         try:
+            # プロファイルにログイン状態が残っていればログイン処理を省略
+            self._get(self.BASE_URL)
+            if self._is_logged_in():
+                logger.info("ログイン済みのセッションを再利用します")
+                self._save_cookies()
+                return
+
+            # プロファイルに残らないセッションクッキーは保存しておいたファイルから復元
+            if self._restore_cookies() and self._is_logged_in():
+                logger.info("保存したクッキーでログイン状態を復元しました")
+                return
+
             logger.info("TikTokにログインを試みます")
-            self.driver.get(f"{self.BASE_URL}/login/phone-or-email/email")
-            self._random_sleep(2.0, 4.0)
+            self._get(f"{self.BASE_URL}/login/phone-or-email/email")
 
             # ログインフォームの要素を待機
-            username_input = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input[name='username']"))
-            )
-            self._random_sleep(1.0, 2.0)
+            username_input = self.wait.until(WAITERS["username_input"])
 
+            # フォーム入力の間隔はボット対策なので短めに残す
             # メールアドレスを入力
+            self._random_sleep(0.2, 0.6)
             username_input.send_keys(self.crawler_account.username)
-            self._random_sleep(1.5, 2.5)
 
             # パスワード入力欄を探す
-            password_input = self.driver.find_element(By.CSS_SELECTOR, "input[type='password']")
+            password_input = self.driver.find_element(*SELECTORS["password_input"])
+            self._random_sleep(0.2, 0.6)
             password_input.send_keys(self.crawler_account.password)
-            self._random_sleep(1.0, 2.0)
 
             # ログインボタンを探してクリック
-            login_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']"))
-            )
-            self._random_sleep(1.0, 2.0)
+            login_button = self.wait.until(WAITERS["login_button"])
+            self._random_sleep(0.2, 0.6)
             login_button.click()
 
             # ログイン完了を待機
             # プロフィールアイコンが表示されるまで待機
-            self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-e2e='profile-icon']"))
-            )
+            self.wait.until(WAITERS["profile_icon"])
             logger.info("ログインに成功しました")
+            self._save_cookies()
 
         except Exception as e:
             logger.error(f"ログインに失敗: {e}")
@@ -128,139 +336,281 @@ class TikTokCrawler:
     def navigate_to_user_page(self, username: str) -> bool:
         logger.debug(f"アカウント {username} のページに移動")
         try:
-            self.driver.get(f"{self.BASE_URL}/@{username}")
-            self._random_sleep(2.0, 4.0)
-            
-            # ユーザーページの読み込みを確認
-            self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-e2e='user-post-item']"))
-            )
+            # eagerなのでDOMContentLoadedで戻り、この時点で埋め込みJSONは読める
+            # 動画一覧の描画は待たない（DOMから取るときはget_like_stats_from_user_pageで待つ）
+            self._get(f"{self.BASE_URL}/@{username}")
             return True
             
         except Exception as e:
             logger.error(f"ユーザー {username} のページへの移動に失敗: {e}")
             return False
 
+    def _extract_video_stats(self, count_selectors: Dict[str, str], max_videos: int) -> Dict[str, List[Dict[str, str]]]:
+        """
+        動画一覧をスクロールして読み込みながら、URLと数値（表示形式のまま）を1回のスクリプト実行でまとめて取得
+        スクロールと読み込み待ちはブラウザ内で行うので、要素ごと・スクロールごとにWebDriverを往復しない
+
+        Args:
+            count_selectors: 項目名 -> 動画要素内の数値要素のセレクター
+            max_videos: 最大件数
+
+        Returns:
+            項目名 -> その数値が取れた動画のリスト
+        """
+        list_load_config = CRAWL_CONFIG['list_load_config']
+        raw_stats = self.driver.execute_async_script(
+            VIDEO_STATS_SCRIPT,
+            max_videos,
+            POST_ITEM_CSS,
+            count_selectors,
+            list_load_config['timeout'] * 1000,
+            list_load_config['stable_time'] * 1000
+        )
+        logger.debug(f"動画要素を{len(raw_stats)}件取得")
+
+        video_stats = {key: [] for key in count_selectors}
+        for raw_stat in raw_stats:
+            video_url = raw_stat["url"]
+            account_username, video_id = parse_tiktok_video_url(video_url)
+            if not video_id:
+                logger.warning(f"動画情報の取得に失敗: {raw_stat}")
+                continue
+
+            for key, count_text in raw_stat["counts"].items():
+                if count_text is None:
+                    continue
+                video_stats[key].append({
+                    "url": video_url,
+                    "link": raw_stat["link"],  # 動画ページへの移動で要素を探し直さずにクリックする
+                    "video_id": video_id,
+                    "account_username": account_username,
+                    "count_text": count_text
+                })
+        return video_stats
+
     def get_like_stats_from_user_page(self, max_videos: int = 50) -> List[Dict[str, str]]:
-        video_stats = []
+        """ユーザーページの動画一覧からいいね数を取得（再生数は「クリエイターの動画」タブから取得する）"""
         try:
             logger.debug(f"いいね数の取得を開始（最大{max_videos}件）")
-            # 動画要素を取得
-            video_elements = self.wait.until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "[data-e2e='user-post-item']"))
-            )
-            logger.debug(f"動画要素を{len(video_elements)}件取得")
-            
-            for video_element in video_elements[:max_videos]:
-                try:
-                    # 動画の基本情報を取得
-                    video_link = video_element.find_element(By.TAG_NAME, "a")
-                    video_url = video_link.get_attribute("href")
-                    
-                    # いいね数を取得（表示形式のまま）
-                    like_count_element = video_element.find_element(By.CSS_SELECTOR, "[data-e2e='video-views']") # video-viewsといいながらいいね数なんだよな
-                    like_count_text = like_count_element.text
-                    
-                    video_stats.append({"url": video_url, "count_text": like_count_text})
-                    logger.debug(f"いいね数を取得: {video_url} -> {like_count_text}")
-                    
-                except NoSuchElementException as e:
-                    logger.warning(f"動画情報の取得に失敗: {e}")
-                    continue
-                    
+            # 動画要素の表示を待機
+            self.page_wait.until(WAITERS["post_item"])
+
+            video_stats = self._extract_video_stats({"like": LIKE_COUNT_CSS}, max_videos)["like"]
+            logger.debug(f"いいね数を取得: {len(video_stats)}件")
             return video_stats
             
         except Exception as e:
             logger.error(f"動画一覧の取得に失敗: {e}")
-            return {}
+            return []
+
+    def _build_like_stat_rows(self, like_stats: List[Dict[str, str]], crawled_at: datetime) -> List[VideoLikeStatRawData]:
+        return [
+            VideoLikeStatRawData(
+                id=None,
+                video_id=stat["video_id"],
+                url=stat["url"],
+                account_username=stat["account_username"],
+                count_text=stat["count_text"],
+                # DOMから取った場合は表示形式（12.3Kなど）をパースする
+                count=stat["count"] if stat.get("count") is not None else parse_tiktok_count(stat["count_text"]),
+                crawled_at=crawled_at
+            )
+            for stat in like_stats
+        ]
 
-    def save_video_like_stats(self, like_stats: List[Dict[str, str]]):
+    def save_video_like_stats(self, like_stats: List[Dict[str, str]], crawled_at: datetime):
         """動画のいいね数データを保存"""
         try:
             logger.debug(f"いいね数データの保存を開始（{len(like_stats)}件）")
-            now = datetime.now()
-            
-            for stat in like_stats:
-                url = stat["url"]
-                like_count_text = stat["count_text"]
-                video_id = url.split("/")[-1]
-                account_username = url.split("/")[2].strip("@")
-                like_stat = VideoLikeStatRawData(
-                    id=None,
-                    video_id=video_id,
-                    url=url,
-                    account_username=account_username,  
-                    count_text=like_count_text,
-                    count=None,  # 後でパースする
-                    crawled_at=now
-                )
-                self.video_repo.save_video_like_stats(like_stat)
-                logger.debug(f"いいね数データを保存: {video_id} -> {like_count_text}")
+            like_stat_list = self._build_like_stat_rows(like_stats, crawled_at)
+            self.video_repo.save_video_like_stats_bulk(like_stat_list)
+            logger.debug(f"いいね数データを保存: {len(like_stat_list)}件")
         except Exception as e:
             logger.error(f"いいね数データの保存に失敗: {e}")
 
-    def navigate_to_video_page(self, video_url: str) -> bool:
+    def get_video_datas_from_embedded_json(self, max_videos: int = 50) -> List[Dict]:
+        """
+        ユーザーページに埋め込まれたJSONから動画一覧（いいね数・再生数・説明）を取得
+        埋め込みJSONに動画一覧が無ければ空リストを返すので、その場合はDOMから取得する
+        """
+        try:
+            state_text = self.driver.execute_script(EMBEDDED_STATE_SCRIPT)
+            if not state_text:
+                return []
+            videos = parse_embedded_video_list(json.loads(state_text), self.BASE_URL)[:max_videos]
+            logger.debug(f"埋め込みJSONから動画を{len(videos)}件取得")
+            return videos
+
+        except Exception as e:
+            logger.warning(f"埋め込みJSONからの動画一覧の取得に失敗: {e}")
+            return []
+
+    def get_video_datas_via_http(self, username: str, max_videos: int = 50) -> List[Dict]:
+        """
+        ブラウザを使わずにユーザーページのHTMLを取得し、埋め込みJSONから動画一覧を取得
+        キャプチャなどで取得できなければ空リストを返すので、その場合はSeleniumで取得する
+        """
+        try:
+            state = self.http_client.get_embedded_state(f"{self.BASE_URL}/@{username}")
+            if not state:
+                return []
+            videos = parse_embedded_video_list(state, self.BASE_URL)[:max_videos]
+            logger.debug(f"HTTPで動画を{len(videos)}件取得")
+            return videos
+
+        except Exception as e:
+            # 先読みは全アカウント分をまとめて行うので、1アカウントの想定外のJSONで全体を止めない
+            logger.warning(f"HTTPでの動画一覧の取得に失敗: {username} -> {e}")
+            return []
+
+    def prefetch_video_datas_via_http(self, usernames: List[str], max_videos: int = 50) -> Dict[str, List[Dict]]:
+        """
+        複数アカウントの動画一覧をブラウザを使わずに並列で取得
+
+        Returns:
+            ユーザー名 -> 動画一覧。取得できなかったアカウントは含まない
+        """
+        if not self.http_client:
+            return {}
+        with ThreadPoolExecutor(max_workers=CRAWL_CONFIG['http_concurrency']) as executor:
+            results = executor.map(lambda username: self.get_video_datas_via_http(username, max_videos), usernames)
+            prefetched = {username: videos for username, videos in zip(usernames, results) if videos}
+        logger.debug(f"HTTPで{len(usernames)}アカウント中{len(prefetched)}アカウントの動画一覧を取得")
+        return prefetched
+
+    @retry_with_backoff(max_attempts=2, exceptions=TRANSIENT_DB_ERRORS)
+    def save_embedded_video_datas(self, videos: List[Dict], crawled_at: datetime):
+        """
+        埋め込みJSONから取得した動画一覧を、いいね数・再生数・説明として保存（コミットは1回）
+        どれかの保存に失敗したら全体をロールバックし、接続切れなど一時的なエラーならトランザクションごと1回だけやり直す
+        （失敗を握りつぶすsave_video_*ではなく、リポジトリを直接呼んで例外をそのまま伝える）
+        """
+        with self.video_repo.transaction():
+            self.video_repo.save_video_like_stats_bulk(self._build_like_stat_rows([
+                {**video, "count_text": str(video["like_count"]), "count": video["like_count"]}
+                for video in videos if video["like_count"] is not None
+            ], crawled_at))
+            self.video_repo.save_video_play_stats_bulk(self._build_play_stat_rows([
+                {**video, "count_text": str(video["play_count"]), "count": video["play_count"]}
+                for video in videos if video["play_count"] is not None
+            ], crawled_at))
+            # 説明は変わらないので、未保存の動画の分だけ保存する
+            existing_video_ids = self.video_repo.get_existing_video_ids([video["video_id"] for video in videos])
+            self.video_repo.save_video_descriptions_bulk(self._build_desc_rows(
+                [video for video in videos if video["video_id"] not in existing_video_ids],
+                crawled_at
+            ))
+        logger.debug(f"埋め込みJSONの動画データを保存: {len(videos)}件")
+
+    def navigate_to_video_page(self, video_url: str, video_link: Optional[WebElement] = None) -> bool:
+        """
+        Args:
+            video_url: 動画のURL
+            video_link: 一覧の取得時に取っておいたリンク要素（あれば探し直さずにクリックする）
+        """
         logger.debug(f"動画ページに移動: {video_url}")
         try:
+            account_username, video_id = parse_tiktok_video_url(video_url)
             # 現在のページにリンクがあればクリック、なければ直接移動
             # クリックで移動しないと、「クリエイターの動画」ではなく「関連動画」タブになる。まあそれでもクローラーは動くけど目的の動画を集めれるかと言うとね
-            try:
-                video_link = self.driver.find_element(By.CSS_SELECTOR, f"a[href='{video_url}'")
-                video_link.click()
-            except NoSuchElementException:
-                self.driver.get(video_url)
-            
-            self._random_sleep(2.0, 4.0)
-            
-            # 動画の詳細情報を待機
-            self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-e2e='user-title']"))
-            )
+            if not video_id:
+                # 動画のURLとして読めなければリンクは探せないので直接移動
+                self._get(video_url)
+            else:
+                try:
+                    if video_link is None:
+                        # 一覧のURLはa.href（絶対URL）から取っているが、href属性は相対パスのこともあるので末尾で照合する
+                        video_path = f"/@{account_username}/video/{video_id}"
+                        video_link = self.driver.find_element(By.CSS_SELECTOR, f"{POST_ITEM_CSS} a[href$='{video_path}']")
+                    # 人間らしさのための待機はクリックの前に入れる
+                    self._random_sleep(1.0, 2.0)
+                    video_link.click()
+                except (NoSuchElementException, StaleElementReferenceException):
+                    self._get(video_url)
+
+            # クリックはSPA内の画面遷移で、user-titleは移動元のユーザーページにもあるので、
+            # まずURLがこの動画のものに変わるのを待ってから動画の詳細情報を待機
+            if video_id:
+                self.page_wait.until(EC.url_contains(video_id))
+            self.page_wait.until(WAITERS["user_title"])
             return True
             
         except Exception as e:
             logger.error(f"動画ページへの移動に失敗: {e}")
             return False
 
+    def _get_video_data_from_embedded_json(self, video_url: str) -> Optional[Dict]:
+        """
+        ページに埋め込まれたJSONから指定した動画の情報を取得
+        クリックでの移動だと埋め込みJSONは移動前のページのままなので、動画IDで探して無ければNoneを返す
+        """
+        try:
+            state_text = self.driver.execute_script(EMBEDDED_STATE_SCRIPT)
+            if not state_text:
+                return None
+            video_id = parse_tiktok_video_url(video_url)[1]
+            if not video_id:
+                return None
+            return parse_embedded_video_detail(json.loads(state_text), video_id, self.BASE_URL)
+
+        except Exception as e:
+            logger.warning(f"埋め込みJSONからの動画説明の取得に失敗: {e}")
+            return None
+
     def get_desc_from_video_page(self) -> Optional[Dict]:
         logger.debug(f"動画説明の取得を開始")
         try:
-            # アカウント情報を取得
-            account_username = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-e2e='user-title']"
-            ).text
-            logger.debug(f"アカウント名を取得: {account_username}")
-
-            account_nickname = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-e2e='user-subtitle']"
-            ).text
-            logger.debug(f"アカウントニックネームを取得: {account_nickname}")
-
-            title = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-e2e='browse-video-desc']"
-            ).text
-            logger.debug(f"動画タイトルを取得: {title}")
-            
-            # 投稿日時を取得
-            posted_at_text = self.driver.find_element(
-                By.CSS_SELECTOR, "[data-e2e='browser-nickname'] span:last-child"
-            ).text
-            logger.debug(f"投稿日時を取得: {posted_at_text}")
+            # 埋め込みJSONにこの動画があれば、投稿日時もパース済みの値で取れる
+            video = self._get_video_data_from_embedded_json(self.driver.current_url)
+            if video:
+                logger.debug(f"埋め込みJSONから動画説明を取得: {video['video_id']}")
+                return video
+
+            # アカウント情報・タイトル・投稿日時・URLを1回のexecute_scriptでまとめて取得
+            desc = self.driver.execute_script(VIDEO_DESC_SCRIPT, VIDEO_DESC_CSS)
+            for key in VIDEO_DESC_CSS:
+                if desc[key] is None:
+                    raise NoSuchElementException(f"{key} の要素が見つかりません")
+
+            video_id = parse_tiktok_video_url(desc["url"])[1]
+            if not video_id:
+                raise ValueError(f"動画のURLではありません: {desc['url']}")
+
+            logger.debug(f"アカウント名を取得: {desc['account_username']}")
+            logger.debug(f"アカウントニックネームを取得: {desc['account_nickname']}")
+            logger.debug(f"動画タイトルを取得: {desc['title']}")
+            logger.debug(f"投稿日時を取得: {desc['posted_at_text']}")
             
             return {
-                "title": title,
-                "posted_at_text": posted_at_text,
-                "account_username": account_username,
-                "account_nickname": account_nickname,
-                "url": self.driver.current_url,
-                "video_id": self.driver.current_url.split("/")[-1]
+                "title": desc["title"],
+                "posted_at_text": desc["posted_at_text"],
+                "account_username": desc["account_username"],
+                "account_nickname": desc["account_nickname"],
+                "url": desc["url"],
+                "video_id": video_id
             }
 
         except Exception as e:
             logger.error(f"動画説明の取得に失敗: {e}")
             return None
 
-    def save_video_desc(self, desc_data: Dict):
+    def _build_desc_rows(self, desc_datas: List[Dict], crawled_at: datetime) -> List[VideoDescRawData]:
+        return [
+            VideoDescRawData(
+                id=None,
+                video_id=desc_data["video_id"],
+                url=desc_data["url"],
+                account_username=desc_data["account_username"],
+                account_nickname=desc_data["account_nickname"],
+                title=desc_data["title"],
+                posted_at_text=desc_data["posted_at_text"],
+                posted_at=desc_data.get("posted_at"),
+                crawled_at=crawled_at
+            )
+            for desc_data in desc_datas
+        ]
+
+    def save_video_desc(self, desc_data: Dict, crawled_at: datetime):
         """動画の説明データを保存"""
         try:
             desc = VideoDescRawData(
@@ -271,8 +621,9 @@ class TikTokCrawler:
                 account_nickname=desc_data["account_nickname"],
                 title=desc_data["title"],
                 posted_at_text=desc_data["posted_at_text"],
-                posted_at=None,  # TODO: posted_at_textのパース処理を実装
-                crawled_at=datetime.now()
+                # DOMから取った場合は表示形式（4日前など）をクロール時刻基準でパースする
+                posted_at=desc_data.get("posted_at") or parse_tiktok_time(desc_data["posted_at_text"], crawled_at),
+                crawled_at=crawled_at
             )
             self.video_repo.save_video_description(desc)
             return True
@@ -284,11 +635,13 @@ class TikTokCrawler:
         logger.debug("動画ページの「クリエイターの動画」タブに移動")
         try:
             # 2番目のタブ（クリエイターの動画）を待機して取得
-            creator_videos_tab = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[class*='DivTabMenuContainer'] [class*='DivTabItemContainer']:nth-child(2) [class*='DivTabItem']"))
-            )
-            creator_videos_tab.click()
+            creator_videos_tab = self.page_wait.until(WAITERS["creator_videos_tab"])
+            # 人間らしさのための待機はクリックの前に入れる
             self._random_sleep(1.0, 2.0)
+            creator_videos_tab.click()
+
+            # 固定時間待つのではなく、タブの動画一覧（再生数）が表示されるまで待機
+            self.page_wait.until(WAITERS["creator_video_play_count"])
             return True
             
         except Exception as e:
@@ -296,81 +649,68 @@ class TikTokCrawler:
             return False
 
     def get_play_stats_from_video_page_creator_videos_tab(self, max_videos: int = 30) -> List[Dict[str, str]]: #これタブ開かなくていいんじゃね
-        video_stats = []
         try:
             logger.debug(f"再生数の取得を開始（最大{max_videos}件）")
-            # 動画要素を取得
-            video_elements = self.wait.until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "[data-e2e='user-post-item']"))
-            )
-            logger.debug(f"動画要素を{len(video_elements)}件取得")
-            
-            for video_element in video_elements[:max_videos]:
-                try:
-                    # 動画の基本情報を取得
-                    video_link = video_element.find_element(By.TAG_NAME, "a")
-                    video_url = video_link.get_attribute("href")
-                    
-                    # 再生数を取得（表示形式のまま）
-                    play_count_element = video_element.find_element(By.CSS_SELECTOR, "strong[data-e2e='video-views'][class*='StrongVideoCount']")
-                    play_count_text = play_count_element.get_attribute("innerText") # ただの.textじゃ取れない
-                    
-                    video_stats.append({"url": video_url, "count_text": play_count_text})
-                    logger.debug(f"再生数を取得: {video_url} -> {play_count_text}")
-                    
-                except NoSuchElementException as e:
-                    logger.warning(f"動画情報の取得に失敗: {e}")
-                    continue
-                    
+            # 動画要素の表示を待機
+            self.page_wait.until(WAITERS["post_item"])
+
+            video_stats = self._extract_video_stats({"play": PLAY_COUNT_CSS}, max_videos)["play"]
+            logger.debug(f"再生数を取得: {len(video_stats)}件")
             return video_stats
             
         except Exception as e:
             logger.error(f"動画一覧の取得に失敗: {e}")
-            return {}
+            return []
 
-    def save_video_play_stats(self, play_stats: List[Dict[str, str]]):
+    def _build_play_stat_rows(self, play_stats: List[Dict[str, str]], crawled_at: datetime) -> List[VideoPlayStatRawData]:
+        return [
+            VideoPlayStatRawData(
+                id=None,
+                video_id=stat["video_id"],
+                url=stat["url"],
+                account_username=stat["account_username"],
+                count_text=stat["count_text"],
+                # DOMから取った場合は表示形式（12.3Kなど）をパースする
+                count=stat["count"] if stat.get("count") is not None else parse_tiktok_count(stat["count_text"]),
+                crawled_at=crawled_at
+            )
+            for stat in play_stats
+        ]
+
+    def save_video_play_stats(self, play_stats: List[Dict[str, str]], crawled_at: datetime):
         """動画の再生数データを保存"""
         try:
             logger.debug(f"再生数データの保存を開始（{len(play_stats)}件）")
-            now = datetime.now()
-            
-            for stat in play_stats:
-                url = stat["url"]
-                play_count_text = stat["count_text"]
-                video_id = url.split("/")[-1]
-                account_username = url.split("/")[2].strip("@")
-                play_stat = VideoPlayStatRawData(
-                    id=None,
-                    video_id=video_id,
-                    url=url,
-                    account_username=account_username,
-                    count_text=play_count_text,
-                    count=None,  # 後でパースする
-                    crawled_at=now
-                )
-                self.video_repo.save_video_play_stats(play_stat)
-                logger.debug(f"再生数データを保存: {video_id} -> {play_count_text}")
+            play_stat_list = self._build_play_stat_rows(play_stats, crawled_at)
+            self.video_repo.save_video_play_stats_bulk(play_stat_list)
+            logger.debug(f"再生数データを保存: {len(play_stat_list)}件")
         except Exception as e:
             logger.error(f"再生数データの保存に失敗: {e}")
 
-    def scroll_page(self, scroll_count: int = 3):
+    def _submit_save(self, save: Callable, *args):
         """
-        ページをスクロールして追加コンテンツを読み込む
-        
-        Args:
-            scroll_count: スクロールする回数
+        DBへの保存を保存用スレッドに回し、その間にブラウザは次のページへ進む
+        保存待ちが溜まりすぎたら古いものから完了を待つ
         """
+        while len(self._pending_saves) >= CRAWL_CONFIG['max_pending_saves']:
+            self._wait_save(self._pending_saves.popleft())
+        self._pending_saves.append(self._save_executor.submit(save, *args))
+
+    def _wait_save(self, future: Future):
         try:
-            for _ in range(scroll_count):
-                self.driver.execute_script(
-                    "window.scrollTo(0, document.body.scrollHeight);"
-                )
-                self._random_sleep(1.0, 2.0)
-                
+            future.result()
         except Exception as e:
-            logger.error(f"ページのスクロールに失敗: {e}")
-
+            logger.error(f"データの保存に失敗: {e}")
 
+    def _save_embedded_account(self, username: str, videos: List[Dict], crawled_at: datetime):
+        """埋め込みJSONから取得したアカウントの動画一覧を保存して、最終クロール時間を更新"""
+        try:
+            self.save_embedded_video_datas(videos, crawled_at)
+        except Exception as e:
+            # 保存できなかったアカウントは最終クロール時間を更新せず、次回も優先してクロールさせる
+            logger.error(f"アカウント {username} の動画データの保存に失敗: {e}")
+            return
+        self.favorite_account_repo.update_favorite_account_last_crawled(username, crawled_at)
 
     def crawl_favorite_accounts(self, max_accounts: int = 10, max_videos_per_account: int = 50):
         try:
@@ -384,56 +724,134 @@ class TikTokCrawler:
                 logger.info("クロール対象のアカウントが見つかりません")
                 return
 
-            # 既存の動画IDを取得（重複チェック用）
-            existing_video_ids = self.video_repo.get_existing_video_ids()
-            logger.debug(f"既存の動画ID数: {len(existing_video_ids)}")
+            # ブラウザを使わない一覧取得は通信待ちが大半なので、全アカウント分を先に並列で取っておく
+            prefetched_videos = self.prefetch_video_datas_via_http(
+                [account.favorite_account_username for account in favorite_accounts],
+                max_videos_per_account
+            )
 
-            # 各アカウントの動画をクロール
-            for account in favorite_accounts:
+            # DBへの保存は1本の保存用スレッドで順に行い、次のアカウントのページ移動と重ねる
+            with ThreadPoolExecutor(max_workers=1) as self._save_executor:
                 try:
-                    logger.info(f"アカウント {account.favorite_account_username} のクロールを開始")
+                    self._crawl_accounts(favorite_accounts, prefetched_videos, max_videos_per_account)
+                finally:
+                    while self._pending_saves:
+                        self._wait_save(self._pending_saves.popleft())
+            
+            logger.info(f"クロール対象のお気に入りアカウント{max_accounts}件に対し処理を完了しました")
+
+        except Exception as e:
+            logger.error(f"クロール処理でエラー: {e}")
+            raise
 
-                    # アカウントページに移動
+    def _crawl_accounts(self, favorite_accounts: List[FavoriteAccount],
+                        prefetched_videos: Dict[str, List[Dict]], max_videos_per_account: int):
+        """お気に入りアカウントを順にクロールする（保存は_submit_saveで保存用スレッドに回す）"""
+        # 各アカウントの動画をクロール
+        for account in favorite_accounts:
+            try:
+                logger.info(f"アカウント {account.favorite_account_username} のクロールを開始")
+                # このアカウントで保存するデータは同じクロール時刻を共有する
+                crawled_at = datetime.now()
+
+                # まずはブラウザを使わずに取得できたものを使う
+                embedded_videos = prefetched_videos.get(account.favorite_account_username)
+
+                # 取れなければアカウントページに移動
+                if not embedded_videos:
+                    # ブラウザを使ったアカウントだけ数えて、一定数ごとに再起動する
+                    self._recycle_driver_if_needed()
+                    self._accounts_since_restart += 1
                     if not self.navigate_to_user_page(account.favorite_account_username):
                         continue
-                    self.scroll_page(3)
-                    video_like_stats = self.get_like_stats_from_user_page(max_videos_per_account)
-                    if not video_like_stats:
-                        continue
-                    self.save_video_like_stats(video_like_stats)
+                    embedded_videos = self.get_video_datas_from_embedded_json(max_videos_per_account)
 
-                    # 動画ページに移動
-                    first_url = video_like_stats[0][0]
-                    if not self.navigate_to_video_page(first_url):
-                        continue
+                # 埋め込みJSONに動画一覧があれば、スクロールも動画ページへの移動も不要
+                if embedded_videos:
+                    self._submit_save(
+                        self._save_embedded_account,
+                        account.favorite_account_username, embedded_videos, crawled_at
+                    )
+                    continue
+
+                video_like_stats = self.get_like_stats_from_user_page(max_videos_per_account)
+                if not video_like_stats:
+                    continue
+                self._submit_save(self.save_video_like_stats, video_like_stats, crawled_at)
+
+                # 説明が未保存の動画を優先して動画ページに移動（再生数の取得にはどの動画ページでもよい）
+                existing_video_ids = self.video_repo.get_existing_video_ids(
+                    [stat["video_id"] for stat in video_like_stats]
+                )
+                new_video_stats = [
+                    stat for stat in video_like_stats
+                    if stat["video_id"] not in existing_video_ids
+                ]
+                logger.debug(f"新規の動画: {len(new_video_stats)}件")
+
+                first_stat = (new_video_stats or video_like_stats)[0]
+                if not self.navigate_to_video_page(first_stat["url"], first_stat.get("link")):
+                    continue
+
+                # 既知の動画なら説明の取得・保存は省略
+                if new_video_stats:
                     video_desc = self.get_desc_from_video_page()
                     if not video_desc:
                         continue
-                    self.save_video_desc(video_desc)
+                    self._submit_save(self.save_video_desc, video_desc, crawled_at)
 
-                    if not self.navigate_to_video_page_creator_videos_tab():
-                        continue
-                    self.scroll_page(3)
-                    video_play_stats = self.get_play_stats_from_video_page_creator_videos_tab(max_videos_per_account)
-                    if not video_play_stats:
-                        continue
-                    self.save_video_play_stats(video_play_stats)
+                # 再生数は「クリエイターの動画」タブから取得
+                if not self.navigate_to_video_page_creator_videos_tab():
+                    continue
+                video_play_stats = self.get_play_stats_from_video_page_creator_videos_tab(max_videos_per_account)
+                if not video_play_stats:
+                    continue
+                self._submit_save(self.save_video_play_stats, video_play_stats, crawled_at)
 
-                    # アカウントの最終クロール時間を更新
-                    self.favorite_account_repo.update_favorite_account_last_crawled(
-                        account.favorite_account_username,
-                        datetime.now()
-                    )
+                # アカウントの最終クロール時間を更新
+                self._submit_save(
+                    self.favorite_account_repo.update_favorite_account_last_crawled,
+                    account.favorite_account_username,
+                    crawled_at
+                )
 
-                except Exception as e:
-                    logger.error(f"アカウント {account.favorite_account_username} のクロール中にエラー: {e}")
-                    continue
-            
-            logger.info(f"クロール対象のお気に入りアカウント{max_accounts}件に対し処理を完了しました")
+            except Exception as e:
+                logger.error(f"アカウント {account.favorite_account_username} のクロール中にエラー: {e}")
+                continue
 
-        except Exception as e:
-            logger.error(f"クロール処理でエラー: {e}")
-            raise
+
+def crawl_with_crawler_account(crawler_account_id: Optional[int] = None, proxy_lock: Optional[threading.Lock] = None):
+    """
+    1つのクローラーアカウントでお気に入りアカウントをクロールする
+    MySQL接続もブラウザもプロセス間で共有できないので、ワーカーごとに作る
+
+    Args:
+        crawler_account_id: 使用するクローラーアカウントのID（Noneなら適当に持ってくる）
+        proxy_lock: 同じプロキシ（プロキシ無しならこのマシンのIP）を使うワーカー同士で同時にアクセスしないためのロック
+    """
+    db = Database()
+    try:
+        crawler = TikTokCrawler(
+            crawler_account_repo=CrawlerAccountRepository(db),
+            favorite_account_repo=FavoriteAccountRepository(db),
+            video_repo=VideoRepository(db)
+        )
+
+        with proxy_lock or nullcontext():
+            try:
+                # クローラーを開始（Selenium初期化とログイン）
+                crawler.start(crawler_account_id)
+
+                # お気に入りアカウントのクロール
+                crawler.crawl_favorite_accounts()
+
+            finally:
+                # クローラーの停止（Seleniumのクリーンアップ）
+                crawler.stop()
+
+    finally:
+        # データベース接続のクリーンアップ
+        db.disconnect()
 
 
 def main():
@@ -442,41 +860,43 @@ def main():
         import argparse
         parser = argparse.ArgumentParser(description="TikTok動画データ収集クローラー")
         parser.add_argument("--account-id", type=int, help="使用するクローラーアカウントのID")
+        parser.add_argument("--workers", type=int, default=1, help="並列に動かすクローラーアカウント（ブラウザ）の数")
         args = parser.parse_args()
 
-        # データベース接続の初期化
+        if args.account_id is not None or args.workers <= 1:
+            crawl_with_crawler_account(args.account_id)
+            return
+
+        # 使ってない順にクローラーアカウントを取得
         db = Database()
-        
-        # 各リポジトリの初期化
-        crawler_account_repo = CrawlerAccountRepository(db)
-        favorite_account_repo = FavoriteAccountRepository(db)
-        video_repo = VideoRepository(db)
-        
-        # クローラーの初期化
-        crawler = TikTokCrawler(
-            crawler_account_repo=crawler_account_repo,
-            favorite_account_repo=favorite_account_repo,
-            video_repo=video_repo
-        )
-        
         try:
-            # クローラーを開始（Selenium初期化とログイン）
-            crawler.start(args.account_id)
-            
-            # お気に入りアカウントのクロール
-            crawler.crawl_favorite_accounts()
-            
+            crawler_accounts = CrawlerAccountRepository(db).get_available_crawler_accounts(args.workers)
         finally:
-            # クローラーの停止（Seleniumのクリーンアップ）
-            crawler.stop()
+            db.disconnect()
+        if not crawler_accounts:
+            raise Exception("利用可能なクローラーアカウントがありません")
+
+        # お気に入りアカウントはクローラーアカウントに紐づいているので、アカウントごとに1ワーカー
+        # JSONのパースやHTTPの先読みでGILを取り合わないよう、ワーカーはプロセスにする
+        # 同じプロキシを使うアカウント同士は直列に実行する（ロックはプロセス間で共有できるManagerのもの）
+        with multiprocessing.Manager() as manager, \
+                ProcessPoolExecutor(max_workers=len(crawler_accounts)) as executor:
+            # プロキシを使わないアカウントはどれもこのマシンのIPから出るので、1つのロックを共有させる
+            proxy_locks = {account.proxy or DIRECT_PROXY_KEY: manager.Lock() for account in crawler_accounts}
+            logger.info(f"クローラーアカウント{len(crawler_accounts)}件で並列にクロールします")
+            futures = {
+                executor.submit(crawl_with_crawler_account, account.id, proxy_locks[account.proxy or DIRECT_PROXY_KEY]): account
+                for account in crawler_accounts
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"クローラーアカウント {futures[future].id} の処理でエラー: {e}")
             
     except Exception as e:
         logger.error(f"メイン処理でエラー: {e}")
         raise
-    
-    finally:
-        # データベース接続のクリーンアップ
-        db.disconnect()
 
 
 if __name__ == "__main__":
@@ -64,7 +64,9 @@ CREATE_TABLES_SQL = [
         count_text VARCHAR(255) NOT NULL,  -- 表示形式のままの再生数
         count INT,  -- パース後の数値
         crawled_at DATETIME NOT NULL,
+        crawled_date DATE AS (DATE(crawled_at)) STORED,  -- 1動画1日1件に集約するためのキー
         created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE KEY uk_video_crawled_date (video_id, crawled_date),
         INDEX idx_video_id (video_id),
         INDEX idx_account_username (account_username),
         INDEX idx_crawled_at (crawled_at)
@@ -79,7 +81,9 @@ CREATE_TABLES_SQL = [
         count_text VARCHAR(255) NOT NULL,  -- 表示形式のままのいいね数
         count INT,  -- パース後の数値
         crawled_at DATETIME NOT NULL,
+        crawled_date DATE AS (DATE(crawled_at)) STORED,  -- 1動画1日1件に集約するためのキー
         created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE KEY uk_video_crawled_date (video_id, crawled_date),
         INDEX idx_video_id (video_id),
         INDEX idx_account_username (account_username),
         INDEX idx_crawled_at (crawled_at)
@@ -87,6 +91,46 @@ CREATE_TABLES_SQL = [
     """
 ]
 
+# (video_id, crawled_date) のユニークキーより前に作ったテーブルに、同じ日の重複を整理してからキーを追加する
+STAT_TABLES = ["video_play_stat_raw_data", "video_like_stat_raw_data"]
+
+def migrate_stat_tables(cursor):
+    """
+    既存の統計テーブルにcrawled_date列とuk_video_crawled_dateを追加する（何度実行してもよい）
+    CREATE TABLE IF NOT EXISTS は既存のテーブルを変更しないので、キーが無いとupsertが通常のINSERTになり重複が溜まる
+    """
+    for table in STAT_TABLES:
+        cursor.execute(
+            "SELECT COUNT(*) FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = 'crawled_date'",
+            (table,)
+        )
+        if cursor.fetchone()[0] == 0:
+            cursor.execute(
+                f"ALTER TABLE {table} "
+                f"ADD COLUMN crawled_date DATE AS (DATE(crawled_at)) STORED AFTER crawled_at"
+            )
+            logger.info(f"{table} にcrawled_date列を追加しました")
+
+        cursor.execute(
+            "SELECT COUNT(*) FROM information_schema.STATISTICS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = 'uk_video_crawled_date'",
+            (table,)
+        )
+        if cursor.fetchone()[0] == 0:
+            # 同じ動画・同じ日の行は、upsertと同じく最後にクロールしたものだけ残す
+            cursor.execute(f"""
+                DELETE older FROM {table} older
+                JOIN {table} newer
+                    ON newer.video_id = older.video_id
+                    AND newer.crawled_date = older.crawled_date
+                    AND (newer.crawled_at > older.crawled_at
+                         OR (newer.crawled_at = older.crawled_at AND newer.id > older.id))
+            """)
+            logger.info(f"{table} の同じ日の重複を{cursor.rowcount}件削除しました")
+            cursor.execute(f"ALTER TABLE {table} ADD UNIQUE KEY uk_video_crawled_date (video_id, crawled_date)")
+            logger.info(f"{table} にuk_video_crawled_dateを追加しました")
+
 def create_database():
     """データベースを作成する"""
     try:
@@ -119,6 +163,9 @@ def create_tables():
         for create_table_sql in CREATE_TABLES_SQL:
             cursor.execute(create_table_sql)
             logger.info(f"テーブルを作成しました: {create_table_sql.split('CREATE TABLE IF NOT EXISTS')[1].split('(')[0].strip()}")
+
+        # 以前のバージョンで作ったテーブルを今のスキーマに合わせる
+        migrate_stat_tables(cursor)
         
         conn.commit()
         logger.info("全てのテーブルの作成が完了しました")
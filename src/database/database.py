@@ -1,14 +1,23 @@
 import mysql.connector
-from mysql.connector import Error
-from typing import Optional
+import threading
+from contextlib import contextmanager
+from mysql.connector import Error, InterfaceError, OperationalError
+from typing import Callable, Optional, List
 from ..config import DB_CONFIG
 from ..logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# リトライすれば通る見込みのある例外（接続切れ・タイムアウト・デッドロックなど）
+# 制約違反やSQLの誤りなど、何度やっても同じ結果になるものは含めない
+TRANSIENT_DB_ERRORS = (OperationalError, InterfaceError)
+
 class Database:
     def __init__(self):
         self.connection = None
+        self.in_transaction = False  # Trueの間はクエリごとにコミットしない
+        # 保存用のスレッドと接続を共有するので、クエリ（トランザクション中はその全体）を排他にする
+        self._lock = threading.RLock()
 
     def connect(self):
         try:
@@ -25,24 +34,89 @@ class Database:
 
     def get_connection(self):
         if not self.connection or not self.connection.is_connected():
+            # 再接続するとそれまでのトランザクション中の更新が黙って消えるので、トランザクション中は失敗にする
+            if self.in_transaction:
+                raise OperationalError("トランザクション中にデータベース接続が切れました")
             self.connect()
         return self.connection
 
     def execute_query(self, query: str, params: Optional[tuple] = None):
-        try:
-            cursor = self.get_connection().cursor()
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            
-            # SELECT文の場合はコミットしない
-            if not query.strip().upper().startswith('SELECT'):
-                self.connection.commit()
-            
-            return cursor
-        except Error as e:
-            logger.error(f"クエリ実行エラー: {e}")
-            if not query.strip().upper().startswith('SELECT'):
-                self.connection.rollback()
-            raise
+        """
+        クエリを実行する
+        カーソルの読み出しや後始末が他のスレッドのクエリと混ざらないよう、ロックの中で結果まで取り出して閉じる
+
+        Returns:
+            SELECT文なら全行のリスト、それ以外は影響を受けた行数
+        """
+        return self._execute(query, params, lambda cursor: cursor.rowcount)
+
+    def execute_insert(self, query: str, params: Optional[tuple] = None) -> int:
+        """INSERT文を実行して、追加した行のIDを返す"""
+        return self._execute(query, params, lambda cursor: cursor.lastrowid)
+
+    def _execute(self, query: str, params: Optional[tuple], result: Callable):
+        is_select = query.strip().upper().startswith('SELECT')
+        with self._lock:
+            cursor = None
+            try:
+                cursor = self.get_connection().cursor()
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+
+                if is_select:
+                    return cursor.fetchall()
+
+                # トランザクション中はコミットしない
+                if not self.in_transaction:
+                    self.connection.commit()
+                return result(cursor)
+            except Error as e:
+                logger.error(f"クエリ実行エラー: {e}")
+                if not is_select and not self.in_transaction:
+                    self.connection.rollback()
+                raise
+            finally:
+                if cursor:
+                    cursor.close()
+
+    def execute_many(self, query: str, params_list: List[tuple]) -> int:
+        """
+        同じクエリを複数のパラメータでまとめて実行する（1回のコミット）
+
+        Returns:
+            影響を受けた行数
+        """
+        with self._lock:
+            cursor = None
+            try:
+                cursor = self.get_connection().cursor()
+                cursor.executemany(query, params_list)
+                if not self.in_transaction:
+                    self.connection.commit()
+                return cursor.rowcount
+            except Error as e:
+                logger.error(f"クエリ実行エラー: {e}")
+                if not self.in_transaction:
+                    self.connection.rollback()
+                raise
+            finally:
+                if cursor:
+                    cursor.close()
+
+    @contextmanager
+    def transaction(self):
+        """ブロック内の更新をまとめて1回でコミットする（例外時はロールバック）"""
+        with self._lock:
+            self.get_connection()
+            self.in_transaction = True
+            try:
+                yield
+                self.get_connection().commit()
+            except Exception:
+                if self.connection and self.connection.is_connected():
+                    self.connection.rollback()
+                raise
+            finally:
+                self.in_transaction = False
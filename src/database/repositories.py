@@ -1,8 +1,9 @@
 from datetime import datetime
-from typing import List, Optional, Set
-from .database import Database
+from typing import FrozenSet, List, Optional
+from .database import Database, TRANSIENT_DB_ERRORS
 from .models import CrawlerAccount, FavoriteAccount, VideoDescRawData, VideoPlayStatRawData, VideoLikeStatRawData
 from ..logger import setup_logger
+from ..retry import retry_with_backoff
 
 logger = setup_logger(__name__)
 
@@ -24,12 +25,59 @@ class CrawlerAccountRepository:
                 last_crawled_at ASC
             LIMIT 1
         """
-        cursor = self.db.execute_query(query)
-        row = cursor.fetchone()
-        cursor.close()
+        rows = self.db.execute_query(query)
+        if not rows:
+            return None
+        row = rows[0]
 
-        if not row:
+        return CrawlerAccount(
+            id=row[0],
+            username=row[1],
+            password=row[2],
+            proxy=row[3],
+            is_alive=row[4],
+            last_crawled_at=row[5]
+        )
+
+    def get_available_crawler_accounts(self, limit: int) -> List[CrawlerAccount]:
+        """利用可能なクローラーアカウントを複数取得(使ってない順)"""
+        query = """
+            SELECT id, username, password, proxy, is_alive, last_crawled_at
+            FROM crawler_accounts
+            WHERE is_alive = TRUE
+            ORDER BY 
+                CASE 
+                    WHEN last_crawled_at IS NULL THEN 1
+                    ELSE 0
+                END DESC,
+                last_crawled_at ASC
+            LIMIT %s
+        """
+        rows = self.db.execute_query(query, (limit,))
+
+        return [
+            CrawlerAccount(
+                id=row[0],
+                username=row[1],
+                password=row[2],
+                proxy=row[3],
+                is_alive=row[4],
+                last_crawled_at=row[5]
+            )
+            for row in rows
+        ]
+
+    def get_crawler_account_by_id(self, crawler_account_id: int) -> Optional[CrawlerAccount]:
+        """IDを指定してクローラーアカウントを取得"""
+        query = """
+            SELECT id, username, password, proxy, is_alive, last_crawled_at
+            FROM crawler_accounts
+            WHERE id = %s
+        """
+        rows = self.db.execute_query(query, (crawler_account_id,))
+        if not rows:
             return None
+        row = rows[0]
 
         return CrawlerAccount(
             id=row[0],
@@ -71,9 +119,7 @@ class FavoriteAccountRepository:
                 last_crawled_at ASC
             LIMIT %s
         """
-        cursor = self.db.execute_query(query, (crawler_account_id, limit))
-        rows = cursor.fetchall()
-        cursor.close()
+        rows = self.db.execute_query(query, (crawler_account_id, limit))
 
         return [
             FavoriteAccount(
@@ -87,6 +133,7 @@ class FavoriteAccountRepository:
             for row in rows
         ]
 
+    @retry_with_backoff(exceptions=TRANSIENT_DB_ERRORS)
     def update_favorite_account_last_crawled(self, username: str, last_crawled_at: datetime):
         """お気に入りアカウントの最終クロール時間を更新"""
         query = """
@@ -97,10 +144,23 @@ class FavoriteAccountRepository:
         self.db.execute_query(query, (last_crawled_at, username))
 
 
+def _outside_transaction(repo, *args, **kwargs) -> bool:
+    """
+    トランザクション中の文は個別にリトライしない
+    （途中の文だけやり直すと前の文との整合が取れないので、トランザクションごと呼び出し側でやり直す）
+    """
+    return not repo.db.in_transaction
+
+
 class VideoRepository:
     def __init__(self, db: Database):
         self.db = db
 
+    def transaction(self):
+        """複数の保存をまとめて1回でコミットする"""
+        return self.db.transaction()
+
+    @retry_with_backoff(exceptions=TRANSIENT_DB_ERRORS, should_retry=_outside_transaction)
     def save_video_description(self, desc: VideoDescRawData):
         """動画の説明データを保存"""
         query = """
@@ -122,34 +182,80 @@ class VideoRepository:
             desc.title, desc.posted_at_text, desc.posted_at, desc.crawled_at
         ))
 
-    def save_video_play_stats(self, stats: VideoPlayStatRawData):
-        """動画の再生数データを保存"""
+    @retry_with_backoff(exceptions=TRANSIENT_DB_ERRORS, should_retry=_outside_transaction)
+    def save_video_descriptions_bulk(self, descs: List[VideoDescRawData]):
+        """動画の説明データをまとめて保存"""
+        if not descs:
+            return
+        query = """
+            INSERT INTO video_desc_raw_data (
+                video_id, url, account_username, account_nickname,
+                title, posted_at_text, posted_at, crawled_at
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                url = VALUES(url),
+                account_username = VALUES(account_username),
+                account_nickname = VALUES(account_nickname),
+                title = VALUES(title),
+                posted_at_text = VALUES(posted_at_text),
+                posted_at = VALUES(posted_at),
+                crawled_at = VALUES(crawled_at)
+        """
+        self.db.execute_many(query, [
+            (desc.video_id, desc.url, desc.account_username, desc.account_nickname,
+             desc.title, desc.posted_at_text, desc.posted_at, desc.crawled_at)
+            for desc in descs
+        ])
+
+    @retry_with_backoff(exceptions=TRANSIENT_DB_ERRORS, should_retry=_outside_transaction)
+    def save_video_play_stats_bulk(self, stats_list: List[VideoPlayStatRawData]):
+        """動画の再生数データをまとめて保存"""
+        if not stats_list:
+            return
         query = """
             INSERT INTO video_play_stat_raw_data (
                 video_id, url, account_username, count_text, count, crawled_at
             ) VALUES (%s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                url = VALUES(url),
+                account_username = VALUES(account_username),
+                count_text = VALUES(count_text),
+                count = VALUES(count),
+                crawled_at = VALUES(crawled_at)
         """
-        self.db.execute_query(query, (
-            stats.video_id, stats.url, stats.account_username,
-            stats.count_text, stats.count, stats.crawled_at
-        ))
+        self.db.execute_many(query, [
+            (stats.video_id, stats.url, stats.account_username,
+             stats.count_text, stats.count, stats.crawled_at)
+            for stats in stats_list
+        ])
 
-    def save_video_like_stats(self, stats: VideoLikeStatRawData):
-        """動画のいいね数データを保存"""
+    @retry_with_backoff(exceptions=TRANSIENT_DB_ERRORS, should_retry=_outside_transaction)
+    def save_video_like_stats_bulk(self, stats_list: List[VideoLikeStatRawData]):
+        """動画のいいね数データをまとめて保存"""
+        if not stats_list:
+            return
         query = """
             INSERT INTO video_like_stat_raw_data (
                 video_id, url, account_username, count_text, count, crawled_at
             ) VALUES (%s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                url = VALUES(url),
+                account_username = VALUES(account_username),
+                count_text = VALUES(count_text),
+                count = VALUES(count),
+                crawled_at = VALUES(crawled_at)
         """
-        self.db.execute_query(query, (
-            stats.video_id, stats.url, stats.account_username,
-            stats.count_text, stats.count, stats.crawled_at
-        ))
+        self.db.execute_many(query, [
+            (stats.video_id, stats.url, stats.account_username,
+             stats.count_text, stats.count, stats.crawled_at)
+            for stats in stats_list
+        ])
 
-    def get_existing_video_ids(self) -> Set[str]:
-        """既存の動画IDを取得"""
-        query = "SELECT video_id FROM video_desc_raw_data"
-        cursor = self.db.execute_query(query)
-        rows = cursor.fetchall()
-        cursor.close()
-        return {row[0] for row in rows}
+    def get_existing_video_ids(self, video_ids: List[str]) -> FrozenSet[str]:
+        """指定した動画IDのうち、説明データが保存済みのものを取得"""
+        if not video_ids:
+            return frozenset()
+        placeholders = ", ".join(["%s"] * len(video_ids))
+        query = f"SELECT video_id FROM video_desc_raw_data WHERE video_id IN ({placeholders})"
+        rows = self.db.execute_query(query, tuple(video_ids))
+        return frozenset(row[0] for row in rows)
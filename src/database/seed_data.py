@@ -26,7 +26,7 @@ def insert_crawler_accounts(db: Database) -> List[int]:
                 %s, %s, %s, %s
             )
         """
-        cursor = db.execute_query(
+        crawler_account_id = db.execute_insert(
             query,
             (
                 crawler_account["username"],
@@ -35,7 +35,7 @@ def insert_crawler_accounts(db: Database) -> List[int]:
                 crawler_account["is_alive"]
             )
         )
-        crawler_account_ids.append(cursor.lastrowid)
+        crawler_account_ids.append(crawler_account_id)
         logger.info(f"クローラーアカウント {crawler_account['username']} を追加しました")
     
     return crawler_account_ids
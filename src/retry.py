@@ -0,0 +1,37 @@
+import functools
+import time
+from typing import Callable, Optional, Tuple, Type
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+def retry_with_backoff(max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 10.0,
+                       exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+                       should_retry: Optional[Callable[..., bool]] = None) -> Callable:
+    """
+    一時的な失敗に対して指数バックオフでリトライするデコレーター
+    
+    Args:
+        max_attempts: 最大試行回数
+        base_delay: 1回目のリトライ前の待機時間（秒）。以降は2倍ずつ増やす
+        max_delay: 待機時間の上限（秒）
+        exceptions: リトライ対象の例外
+        should_retry: 呼び出しと同じ引数を受け取り、Falseを返したらリトライせずに例外をそのまま投げる
+    
+    Returns:
+        デコレーター
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as e:
+                    if attempt == max_attempts or (should_retry and not should_retry(*args, **kwargs)):
+                        raise
+                    delay = min(base_delay * 2 ** (attempt - 1), max_delay)
+                    logger.warning(f"{func.__name__} に失敗（{attempt}/{max_attempts}回目）、{delay}秒後にリトライ: {e}")
+                    time.sleep(delay)
+        return wrapper
+    return decorator